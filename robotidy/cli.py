@@ -1,3 +1,6 @@
+import importlib
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import (
     Tuple,
@@ -9,15 +12,12 @@ from typing import (
 )
 
 import click
-import toml
-
-from robotidy.app import Robotidy
-from robotidy.transformers import load_transformers
-from robotidy.utils import (
-    GlobalFormattingConfig,
-    split_args_from_name_or_path,
-    remove_rst_formatting,
-    RecommendationFinder
+
+# robotidy.app and robotidy.utils import robot.api - deferred to function bodies
+# so that robotidy --help / --version don't pull in the Robot Framework import tree
+from robotidy.transformers import (
+    DISABLED_BY_DEFAULT,
+    TRANSFORMERS
 )
 from robotidy.version import __version__
 
@@ -71,6 +71,10 @@ class TransformType(click.ParamType):
     name = "transform"
 
     def convert(self, value, param, ctx):
+        if ':' not in value and ';' not in value:
+            # no embedded arguments to split - skip the path check in split_args_from_name_or_path
+            return value, []
+        from robotidy.utils import split_args_from_name_or_path
         name = ''
         try:
             name, args = split_args_from_name_or_path(value)
@@ -88,37 +92,46 @@ def find_project_root(srcs: Iterable[str]) -> Path:
     If no directory in the tree contains a marker that would specify it's the
     project root, the root of the file system is returned.
     """
+    return _find_project_root(tuple(sorted(set(str(src) for src in srcs))))
+
+
+@lru_cache(maxsize=32)
+def _find_project_root(srcs: Tuple[str, ...]) -> Path:
     if not srcs:
         return Path("/").resolve()
 
     path_srcs = [Path(Path.cwd(), src).resolve() for src in srcs]
 
-    # A list of lists of parents for each 'src'. 'src' is included as a
-    # "parent" of itself if it is a directory
-    src_parents = [
-        list(path.parents) + ([path] if path.is_dir() else []) for path in path_srcs
-    ]
-
-    common_base = max(
-        set.intersection(*(set(parents) for parents in src_parents)),
-        key=lambda path: path.parts,
-    )
+    if len(path_srcs) == 1:
+        common_base = path_srcs[0]
+    else:
+        common_base = Path(os.path.commonpath(path_srcs))
+    if not common_base.is_dir():
+        common_base = common_base.parent
 
     for directory in (common_base, *common_base.parents):
-        if (directory / ".git").exists():
-            return directory
-
-        if (directory / "robotidy.toml").is_file():
-            return directory
-
-        if (directory / "pyproject.toml").is_file():
-            return directory
+        # one scandir per directory instead of one stat per marker file
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name == '.git':
+                        return directory
+                    if entry.name in ('robotidy.toml', 'pyproject.toml') and entry.is_file():
+                        return directory
+        except OSError:
+            continue
 
     return directory
 
 
 def find_and_read_config(src_paths: Iterable[str]) -> Dict[str, Any]:
-    project_root = find_project_root(src_paths)
+    # shallow copy so callers cannot mutate the cached config
+    return dict(_find_and_read_config(tuple(sorted(set(str(src) for src in src_paths)))))
+
+
+@lru_cache(maxsize=32)
+def _find_and_read_config(src_paths: Tuple[str, ...]) -> Dict[str, Any]:
+    project_root = _find_project_root(src_paths)
     config_path = project_root / 'robotidy.toml'
     if config_path.is_file():
         return read_robotidy_config(str(config_path))
@@ -128,27 +141,46 @@ def find_and_read_config(src_paths: Iterable[str]) -> Dict[str, Any]:
     return {}
 
 
+_TOML_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+
 def load_toml_file(path: str) -> Dict[str, Any]:
+    # deferred import - only invocations that actually read a config file pay for it
+    try:
+        import tomllib
+    except ImportError:  # Python < 3.11
+        import tomli as tomllib
     try:
-        config = toml.load(path)
+        stat = os.stat(path)
+        # cache key includes mtime and size so an edited file is reparsed
+        key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+        if key in _TOML_CACHE:
+            return _TOML_CACHE[key]
+        with open(path, 'rb') as fp:
+            config = tomllib.load(fp)
         click.echo(f"Loaded configuration from {path}")
+        _TOML_CACHE[key] = config
         return config
-    except (toml.TomlDecodeError, OSError) as e:
+    except (tomllib.TOMLDecodeError, OSError) as e:
         raise click.FileError(
             filename=path, hint=f"Error reading configuration file: {e}"
         )
 
 
+def normalize_config_keys(config: Dict[str, Any]) -> Dict[str, Any]:
+    return {k.replace('--', '').replace('-', '_'): v for k, v in config.items()}
+
+
 def read_pyproject_config(path: str) -> Dict[str, Any]:
     click.echo('Reading pyproject.toml')
     config = load_toml_file(path)
     config = config.get("tool", {}).get("robotidy", {})
-    return {k.replace('--', '').replace('-', '_'): v for k, v in config.items()}
+    return normalize_config_keys(config)
 
 
 def read_robotidy_config(path: str) -> Dict[str, Any]:
     config = load_toml_file(path)
-    return {k.replace('--', '').replace('-', '_'): v for k, v in config.items()}
+    return normalize_config_keys(config)
 
 
 def read_config(ctx: click.Context, param: click.Parameter, value: Optional[str]) -> Optional[str]:
@@ -162,10 +194,9 @@ def read_config(ctx: click.Context, param: click.Parameter, value: Optional[str]
     # Sanitize the values to be Click friendly. For more information please see:
     # https://github.com/psf/black/issues/1458
     # https://github.com/pallets/click/issues/1567
-    config = {
-        k: str(v) if not isinstance(v, (list, dict)) else v
-        for k, v in config.items()
-    }
+    for k, v in config.items():
+        if not isinstance(v, (str, list, dict)):
+            config[k] = str(v)
 
     default_map: Dict[str, Any] = {}
     if ctx.default_map:
@@ -174,32 +205,37 @@ def read_config(ctx: click.Context, param: click.Parameter, value: Optional[str]
     ctx.default_map = default_map
 
 
+@lru_cache(maxsize=None)
+def get_transformer_class(name: str):
+    """ Import transformer module and return its class without instantiating it """
+    module = importlib.import_module(f'robotidy.transformers.{name}')
+    return getattr(module, name)
+
+
 def print_description(name: str):
-    transformers = load_transformers(None, {}, allow_disabled=True)
-    transformer_by_names = {transformer.__class__.__name__: transformer for transformer in transformers}
+    from robotidy.utils import remove_rst_formatting, RecommendationFinder
     if name == 'all':
-        for tr_name, transformer in transformer_by_names.items():
+        for tr_name in TRANSFORMERS:
             click.echo(f"Transformer {tr_name}:")
-            click.echo(remove_rst_formatting(transformer.__doc__))
-    elif name in transformer_by_names:
+            click.echo(remove_rst_formatting(get_transformer_class(tr_name).__doc__))
+    elif name in TRANSFORMERS:
         click.echo(f"Transformer {name}:")
-        click.echo(remove_rst_formatting(transformer_by_names[name].__doc__))
+        click.echo(remove_rst_formatting(get_transformer_class(name).__doc__))
     else:
         rec_finder = RecommendationFinder()
-        similar = rec_finder.find_similar(name, transformer_by_names.keys())
+        similar = rec_finder.find_similar(name, TRANSFORMERS)
         click.echo(f"Transformer with the name '{name}' does not exist.{similar}")
         return 1
     return 0
 
 
 def print_transformers_list():
-    transformers = load_transformers(None, {}, allow_disabled=True)
     click.echo('To see detailed docs run --desc <transformer_name> or --desc all. '
                'Transformers with (disabled) tag \nare executed only when selected explictly with --transform. '
                'Available transformers:\n')
-    for transformer in transformers:
-        disabled = ' (disabled)' if not getattr(transformer, 'ENABLED', True) else ''
-        click.echo(transformer.__class__.__name__ + disabled)
+    for name in TRANSFORMERS:
+        disabled = ' (disabled)' if name in DISABLED_BY_DEFAULT else ''
+        click.echo(name + disabled)
 
 
 @click.command(cls=RawHelp, help=HELP_MSG, epilog=EPILOG, context_settings=CONTEXT_SETTINGS)
@@ -378,6 +414,9 @@ def cli(
     if config and verbose:
         click.echo(f'Loaded {config} configuration file')
 
+    from robotidy.app import Robotidy
+    from robotidy.utils import GlobalFormattingConfig
+
     formatting_config = GlobalFormattingConfig(
         space_count=spacecount,
         line_sep=lineseparator,
@@ -6,13 +6,9 @@ need to inherit from ``ModelTransformer`` or ``ast.NodeTransformer`` class. Fina
 ``TRANSFORMERS`` variable in this file.
 
 If you don't want to run your transformer by default and only when calling robotidy with --transform YourTransformer
-then add ``ENABLED = False`` class attribute inside.
+then add ``ENABLED = False`` class attribute inside and put the transformer name in ``DISABLED_BY_DEFAULT``.
 """
-from itertools import chain
-from robot.utils.importer import Importer
-from robot.errors import DataError
-
-from robotidy.utils import RecommendationFinder
+from concurrent.futures import ThreadPoolExecutor
 
 
 TRANSFORMERS = [
@@ -32,18 +28,60 @@ TRANSFORMERS = [
     'SplitTooLongLine',
     'SmartSortKeywords'
 ]
+# manifest of transformers with ENABLED = False - allows to skip their import when they would not run anyway
+DISABLED_BY_DEFAULT = {
+    'SmartSortKeywords'
+}
 
 
 class ImportTransformerError(ValueError):
     pass
 
 
+_IMPORTER = None
+_CLASS_CACHE = {}
+
+
+def _get_importer():
+    # deferred import so that robotidy --help / --version don't pull in the Robot Framework import tree
+    global _IMPORTER
+    if _IMPORTER is None:
+        from robot.utils.importer import Importer
+        _IMPORTER = Importer()
+    return _IMPORTER
+
+
+def _resolve_class(name):
+    """ Resolve transformer class by name, reusing classes already resolved in this process """
+    if name not in _CLASS_CACHE:
+        _CLASS_CACHE[name] = _get_importer().import_class_or_module(name)
+    return _CLASS_CACHE[name]
+
+
+def _instantiate(name, imported_class, args):
+    from robot.errors import DataError
+
+    importer = _get_importer()
+    if not (hasattr(importer, '_instantiate_if_needed') and hasattr(importer, '_raise_import_failed')):
+        # private helpers are gone in this Robot Framework version - fall back to the public API,
+        # losing only the benefit of the class-resolution cache
+        return importer.import_class_or_module(name, instantiate_with_args=args)
+    # same as Importer.import_class_or_module with arguments but without re-resolving the class
+    try:
+        return importer._instantiate_if_needed(imported_class, args)
+    except DataError as err:
+        importer._raise_import_failed(name, err)
+
+
 def import_transformer(name, args):
+    from robot.errors import DataError
+
     try:
-        return Importer().import_class_or_module(name, instantiate_with_args=args)
+        return _instantiate(name, _resolve_class(name), args)
     except DataError as err:
         if 'Creating instance failed' in str(err):
             raise err from None
+        from robotidy.utils import RecommendationFinder
         short_name = name.split('.')[-1]
         similar_finder = RecommendationFinder()
         similar = similar_finder.find_similar(short_name, TRANSFORMERS)
@@ -51,6 +89,14 @@ def import_transformer(name, args):
                                      f"Verify if correct name or configuration was provided.{similar}") from None
 
 
+def _args_dict(args):
+    arg_dict = {}
+    for arg in args:
+        param, value = arg.split('=', maxsplit=1)
+        arg_dict[param] = value
+    return arg_dict
+
+
 def load_transformers(allowed_transformers, config, allow_disabled=False):
     """ Dynamically load all classes from this file with attribute `name` defined in allowed_transformers """
     loaded_transformers = []
@@ -58,10 +104,8 @@ def load_transformers(allowed_transformers, config, allow_disabled=False):
         for name, args in allowed_transformers:
             # if we are configure the same param from both --transform and --configure we need to overwrite it
             # it is done by converting to dict and back to list in format of key=value
-            temp_args = {}
-            for arg in chain(args, config.get(name, ())):
-                param, value = arg.split('=', maxsplit=1)
-                temp_args[param] = value
+            temp_args = _args_dict(args)
+            temp_args.update(_args_dict(config.get(name, ())))
             args = [f'{key}={value}' for key, value in temp_args.items()]
             import_name = f'robotidy.transformers.{name}' if name in TRANSFORMERS else name
             imported_class = import_transformer(import_name, args)
@@ -69,10 +113,16 @@ def load_transformers(allowed_transformers, config, allow_disabled=False):
                 return []
             loaded_transformers.append(imported_class)
     else:
-        for name in TRANSFORMERS:
-            imported_class = import_transformer(f'robotidy.transformers.{name}', config.get(name, ()))
-            if imported_class is None:
-                return []
-            if allow_disabled or getattr(imported_class, 'ENABLED', True):
-                loaded_transformers.append(imported_class)
+        names = [name for name in TRANSFORMERS if allow_disabled or name not in DISABLED_BY_DEFAULT]
+        # import in parallel - module imports are mostly I/O bound and distinct modules don't block each other
+        with ThreadPoolExecutor(max_workers=min(8, len(names))) as executor:
+            imported_classes = executor.map(
+                lambda name: import_transformer(f'robotidy.transformers.{name}', config.get(name, ())),
+                names
+            )
+            for imported_class in imported_classes:
+                if imported_class is None:
+                    return []
+                if allow_disabled or getattr(imported_class, 'ENABLED', True):
+                    loaded_transformers.append(imported_class)
     return loaded_transformers
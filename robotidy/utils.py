@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from typing import List
 import difflib
 
@@ -150,7 +151,9 @@ def left_align(node):
     return Statement.from_tokens(tokens)
 
 
+@lru_cache(maxsize=None)
 def remove_rst_formatting(text):
+    """ Strip RST markup from docstring - done only once per unique docstring thanks to the cache """
     return text.replace('::', ':').replace("``", "'")
 
 
@@ -40,7 +40,7 @@ setup(
     install_requires=[
         'robotframework>=4.0',
         'Click>=7.0',
-        'toml>=0.10.2',
+        'tomli>=1.1.0; python_version < "3.11"',
         'colorama>=0.4.3'
     ],
     extras_requires={
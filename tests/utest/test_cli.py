@@ -8,12 +8,14 @@ from click import FileError
 from .utils import run_tidy, save_tmp_model
 from robotidy.cli import (
     find_project_root,
+    get_transformer_class,
+    load_toml_file,
     read_robotidy_config,
     read_pyproject_config,
     read_config
 )
 from robotidy.utils import node_within_lines
-from robotidy.transformers import load_transformers
+from robotidy.transformers import DISABLED_BY_DEFAULT, TRANSFORMERS, load_transformers
 from robotidy.transformers.AlignSettingsSection import AlignSettingsSection
 from robotidy.transformers.ReplaceRunKeywordIf import ReplaceRunKeywordIf
 from robotidy.transformers.SmartSortKeywords import SmartSortKeywords
@@ -92,6 +94,17 @@ class TestCli:
         config = read_robotidy_config(config_path)
         assert config == expected_config
 
+    def test_load_toml_file_cache(self, tmp_path):
+        config_path = tmp_path / 'robotidy.toml'
+        config_path.write_text('overwrite = false\n')
+        config = load_toml_file(str(config_path))
+        assert config == {'overwrite': False}
+        # unchanged file should be served from the cache
+        assert load_toml_file(str(config_path)) is config
+        # modified file should be reparsed
+        config_path.write_text('overwrite = false\nspacecount = 8\n')
+        assert load_toml_file(str(config_path)) == {'overwrite': False, 'spacecount': 8}
+
     def test_read_pyproject_config(self):
         expected_parsed_config = {
             'overwrite': False,
@@ -243,6 +256,14 @@ class TestCli:
         assert "*** settings ***" in result.output
         assert "*** Settings ***" in result.output
 
+    def test_disabled_by_default_matches_enabled_attributes(self):
+        """ DISABLED_BY_DEFAULT manifest should stay in sync with ENABLED class attributes """
+        disabled_by_attribute = {
+            name for name in TRANSFORMERS
+            if not getattr(get_transformer_class(name), 'ENABLED', True)
+        }
+        assert DISABLED_BY_DEFAULT == disabled_by_attribute
+
     def test_disabled_transformer(self):
         transformers = load_transformers(None, {})
         assert all(transformer.__class__.__name__ != 'SmartSortKeywords' for transformer in transformers)